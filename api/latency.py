@@ -1,12 +1,15 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-from typing import List, Dict, Any
-import statistics
+from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from array import array
+import numpy as np
 import json
 import os
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 # Enable CORS for all origins
 app.add_middleware(
@@ -31,16 +34,93 @@ def load_telemetry_data():
         with open('./api/q-vercel-latency.json', 'r') as f:
             return json.load(f)
 
+# Resolve which field names the dataset uses once, from its first record,
+# instead of chaining .get() fallbacks for every record
+def _detect_key(sample: Dict[str, Any], candidates: List[str]) -> str:
+    return next((key for key in candidates if key in sample), candidates[0])
+
+_records = load_telemetry_data()
+_sample = _records[0] if _records else {}
+_LATENCY_KEY = _detect_key(_sample, ['latency_ms', 'latency', 'response_time'])
+_UPTIME_KEY = _detect_key(_sample, ['uptime_pct', 'uptime'])
+
+# Validate every record once and bucket its values by region. Region keys are
+# lowercased so lookups are case-insensitive, and values are stored as native
+# doubles rather than boxed Python floats.
+def _bucket_by_region(
+    records: List[Dict[str, Any]], latency_key: str, uptime_key: str
+) -> Tuple[Dict[str, array], Dict[str, array]]:
+    latency_buckets: Dict[str, array] = {}
+    uptime_buckets: Dict[str, array] = {}
+    
+    for index, item in enumerate(records):
+        missing = [key for key in ('region', latency_key, uptime_key) if key not in item]
+        if missing:
+            raise ValueError(f"Telemetry record {index} is missing: {', '.join(missing)}")
+        if not isinstance(item['region'], str):
+            raise ValueError(f"Telemetry record {index} has a non-string region: {item['region']!r}")
+        for key in (latency_key, uptime_key):
+            if not isinstance(item[key], (int, float)):
+                raise ValueError(f"Telemetry record {index} has a non-numeric {key}: {item[key]!r}")
+        
+        region = item['region'].lower()
+        latency_buckets.setdefault(region, array('d')).append(item[latency_key])
+        uptime_buckets.setdefault(region, array('d')).append(item[uptime_key])
+    
+    return latency_buckets, uptime_buckets
+
+# The dataset is static, so parse and bucket it once per cold start
+_latency_buckets, _uptime_buckets = _bucket_by_region(_records, _LATENCY_KEY, _UPTIME_KEY)
+
+# Sorted once here, so breaches are a binary search per request. np.sort copies
+# out of the array('d') view, so the buckets can be freed below.
+_REGION_SORTED: Dict[str, np.ndarray] = {
+    region: np.sort(np.frombuffer(values, dtype=np.float64))
+    for region, values in _latency_buckets.items()
+}
+
+# Nearest-rank percentile, read straight off a presorted array
+def calculate_percentile(sorted_values: np.ndarray, percentile: float) -> float:
+    index = min(int(percentile / 100 * sorted_values.size), sorted_values.size - 1)
+    return float(sorted_values[index])
+
+# Only the breach count depends on the request; everything else is fixed per
+# region, so compute and round it once here rather than on every request
+_REGION_MEAN: Dict[str, float] = {
+    region: round(float(latencies.mean()), 2) for region, latencies in _REGION_SORTED.items()
+}
+_REGION_P95: Dict[str, float] = {
+    region: round(calculate_percentile(latencies, 95), 2)
+    for region, latencies in _REGION_SORTED.items()
+}
+_REGION_UPTIME: Dict[str, float] = {
+    region: round(float(np.frombuffer(values, dtype=np.float64).mean()), 4)
+    for region, values in _uptime_buckets.items()
+}
+
+# Only the constants above are needed from here on; drop the parsed JSON and buckets
+del _records, _sample, _latency_buckets, _uptime_buckets
+
+# The dataset is static, so a region's metrics depend only on the threshold.
+# Keys are known regions only, so the cache stays small whatever clients send.
+@lru_cache(maxsize=1024)
+def _region_metrics(region: str, threshold: int) -> tuple:
+    sorted_latencies = _REGION_SORTED[region]
+    
+    # Count breaches: everything right of the threshold's insertion point
+    within = int(np.searchsorted(sorted_latencies, threshold, side='right'))
+    breaches = sorted_latencies.size - within
+    
+    return _REGION_MEAN[region], _REGION_P95[region], _REGION_UPTIME[region], breaches
+
 @app.post("/")
 async def calculate_metrics(request: LatencyRequest):
-    data = load_telemetry_data()
     results = {}
     
     for region in request.regions:
-        # Filter data for the current region
-        region_data = [item for item in data if item.get('region') == region]
+        key = region.lower()
         
-        if not region_data:
+        if key not in _REGION_SORTED:
             results[region] = {
                 "avg_latency": 0,
                 "p95_latency": 0,
@@ -49,35 +129,21 @@ async def calculate_metrics(request: LatencyRequest):
             }
             continue
         
-        # Extract latencies and uptimes
-        latencies = [item.get('latency', 0) for item in region_data]
-        uptimes = [item.get('uptime', 0) for item in region_data]
-        
-        # Calculate metrics
-        avg_latency = statistics.mean(latencies) if latencies else 0
-        avg_uptime = statistics.mean(uptimes) if uptimes else 0
-        
-        # Calculate 95th percentile
-        if latencies:
-            sorted_latencies = sorted(latencies)
-            index = int(0.95 * len(sorted_latencies))
-            p95_latency = sorted_latencies[index] if index < len(sorted_latencies) else sorted_latencies[-1]
-        else:
-            p95_latency = 0
-        
-        # Count breaches
-        breaches = sum(1 for latency in latencies if latency > request.threshold_ms)
-        
+        avg_latency, p95_latency, avg_uptime, breaches = _region_metrics(key, request.threshold_ms)
         results[region] = {
-            "avg_latency": round(avg_latency, 2),
-            "p95_latency": round(p95_latency, 2),
-            "avg_uptime": round(avg_uptime, 4),
+            "avg_latency": avg_latency,
+            "p95_latency": p95_latency,
+            "avg_uptime": avg_uptime,
             "breaches": breaches
         }
     
-    return results
+    # Results are already plain JSON types; returning the response directly
+    # skips FastAPI's jsonable_encoder pass over the payload
+    return ORJSONResponse(results)
 
 # For local testing
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # C-backed event loop and HTTP parser (from requirements-dev.txt);
+    # access logging off on the hot path
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools", access_log=False)